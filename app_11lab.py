@@ -10,6 +10,7 @@ from gtts import gTTS
 from openai import OpenAI
 from streamlit_webrtc import webrtc_streamer, WebRtcMode
 from aiortc.contrib.media import MediaRecorder
+from interview_store import save_widget_edit
 
 # Import the ElevenLabs library
 from elevenlabs.client import ElevenLabs
@@ -255,6 +256,7 @@ else:
                 progress_bar.progress((i + 1) / len(st.session_state.timestamps))
             
             st.session_state.transcriptions = results
+            json_filename = st.session_state.video_filename.with_suffix(".json")
 
             st.header("Результаты (можно редактировать)")
             for i, r in enumerate(st.session_state.transcriptions):
@@ -263,11 +265,14 @@ else:
                 # Create a unique key for each text_area widget
                 unique_key = f"transcription_edit_{i}"
                 
-                # Display the transcription in an editable text area
+                # Display the transcription in an editable text area.
+                # Edits are appended to <name>.edits.jsonl instead of rewriting the JSON
                 edited_text = st.text_area(
                     label="Ответ:",
                     value=r['transcription'],
-                    key=unique_key
+                    key=unique_key,
+                    on_change=save_widget_edit,
+                    args=(json_filename, i, unique_key, st.session_state),
                 )
                 
                 # IMPORTANT: Update the session state with the edited text
@@ -296,11 +301,10 @@ else:
                 "video_file": st.session_state.video_filename.name,
                 "answers": st.session_state.transcriptions
             }
-            json_filename = st.session_state.video_filename.with_suffix(".json")
-            
-            # Write the dictionary to the file in JSON format
-            with open(json_filename, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            # Write the original transcription once; later edits go to the edits file
+            if not json_filename.exists():
+                with open(json_filename, "w", encoding="utf-8") as f:
+                    json.dump(json_data, f, ensure_ascii=False, indent=2)
 
             # Show a success message
             # st.success(f"Транскрипт сохранён в файл: {json_filename.name}")
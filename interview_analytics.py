@@ -0,0 +1,253 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from interview_store import REC_DIR, iter_interviews
+
+# ========== CONFIG ==========
+# Negated phrases are cut out of an answer before keywords are matched:
+# "не был судим", "нет не пил не курил", "нет кредитов" (negator first) and
+# "кредитов нет", "судимостей не было", "суицидальных мыслей не было",
+# "наркотики никогда не пробовал" (negation after the keyword). Words are
+# joined by whitespace only, so a cut never crosses a comma.
+NEGATOR = r"(?:ни\s+разу\s+не|никогда\s+не|никаких|никогда|без|нет|не)"
+NEGATED = (
+    # negator + optional "был/имел" + one word that is not itself a negator
+    r"\b" + NEGATOR + r"\b"
+    r"(?:\s+(?:был[аио]?|имел[аио]?сь?)\b)?"
+    r"(?:\s+(?!(?:не|нет|ни|никогда)\b)[\w-]+)?"
+    # [adjective] noun + "не <verb>" / "нет"
+    r"|(?:\b[\w-]+(?:ых|их|ого|его|ой|ый|ий|ая|ое|ые)\s+)?\b[\w-]+\s+"
+    r"(?:ни\s+разу\s+|никогда\s+)?(?:не\s+[\w-]+|нет\b)"
+)
+YES_WORDS = r"\b(?:да|есть|пытал\w*)\b"
+# "был/имел" counts as yes, but not in "были ли" / "ли были"
+WAS_WORDS = r"(?<!\bли\s)\b(?:был[аио]?|имел[аио]?сь?)\b(?!\s+ли\b)"
+UNSURE = r"\bне\s+(?:знаю|помню|уверен\w*)\b"
+
+FAMILY_SUICIDE_Q = r"самоубийства или суицидальные попытки у родственников"
+SELF_SUICIDE_Q = r"у Вас в прошлом суицидальные"
+FAMILY_HISTORY_Q = r"в Вашей семье или у ближайших родственников"
+SELF_HISTORY_Q = r"у Вас до армии факты"
+
+SUBSTANCE_WORDS = r"алкогол|пь[её]т|\bпил|\bпью|нарко|запо"
+CRIMINAL_WORDS = r"суд[иы]м|сид[еи]т|сидел|тюрьм|срок|колони"
+NEURO_WORDS = r"психиатр|невроло|психическ|шизофрен|эпилеп|припад"
+GAMBLING_WORDS = r"ставл|ставк|казино|букмекер|игромани|игра[юе]"
+
+# How a bare "да"/"есть"/"был" answer is counted by a rule
+BARE_YES = "yes"                  # counts for the flag
+KEYWORD_ONLY = "keyword"          # ignored, only the rule's keywords count
+UNSPECIFIED = "unspecified"       # counts only if no other flag hit the answer
+
+# (flag, question pattern, keywords in the answer with negations cut,
+#  pattern on the raw answer, bare yes handling)
+#
+# On the combined alcoholism/drugs/criminal record/neuro questions a category
+# is set only by its own keyword; a plain "да" there gives *_unspecified so it
+# still shows up among flagged interviews. Questions about the family give
+# family_* flags, questions about the candidate give unprefixed ones. The
+# seizures question asks about "relatives or you" and counts for the candidate.
+RISK_RULES = [
+    ("family_suicide", FAMILY_SUICIDE_Q, r"суицид|самоуб|вскры|повес", None, BARE_YES),
+    ("suicide", SELF_SUICIDE_Q, r"суицид|самоуб|вскры|повес|мысл", None, BARE_YES),
+    ("family_substance", FAMILY_HISTORY_Q, SUBSTANCE_WORDS, None, KEYWORD_ONLY),
+    ("family_criminal", FAMILY_HISTORY_Q, CRIMINAL_WORDS, None, KEYWORD_ONLY),
+    ("family_neuro", FAMILY_HISTORY_Q, NEURO_WORDS, None, KEYWORD_ONLY),
+    ("family_history_unspecified", FAMILY_HISTORY_Q, None, None, UNSPECIFIED),
+    ("substance", SELF_HISTORY_Q, SUBSTANCE_WORDS, None, KEYWORD_ONLY),
+    ("criminal", SELF_HISTORY_Q, CRIMINAL_WORDS, None, KEYWORD_ONLY),
+    ("neuro", SELF_HISTORY_Q, NEURO_WORDS, None, KEYWORD_ONLY),
+    ("gambling", SELF_HISTORY_Q, GAMBLING_WORDS, None, KEYWORD_ONLY),
+    ("history_unspecified", SELF_HISTORY_Q, None, None, UNSPECIFIED),
+    ("gambling", r"букмекерских", GAMBLING_WORDS, None, BARE_YES),
+    ("neuro", r"судорожные припадки|недержание мочи", NEURO_WORDS, None, BARE_YES),
+    ("debt", r"кредиты/займы", r"кредит|займ|долг|тысяч|тенге", None, BARE_YES),
+    (
+        "hidden_health", r"ВВК", r"диагноз|скрыл|утаил",
+        r"\bне\s+(?:сказал|говорил|прош[её]л|полностью)", KEYWORD_ONLY,
+    ),
+    ("unwilling_service", r"Желаете ли вы проходить военную службу", None,
+     r"^\s*нет\b|\bне\s+(?:хочу|желаю)", KEYWORD_ONLY),
+]
+FLAG_NAMES = list(dict.fromkeys(rule[0] for rule in RISK_RULES))
+
+ERROR_PREFIX = "Ошибка"
+
+# ========== LOADING ==========
+def load_answers(rec_dir: Path = REC_DIR) -> pd.DataFrame:
+    """One row per answer from all saved interviews in ``rec_dir``, edits applied."""
+    return answers_frame(iter_interviews(rec_dir))
+
+def answers_frame(interviews) -> pd.DataFrame:
+    """One row per answer from ``(path, data)`` pairs as yielded by ``iter_interviews``."""
+    columns = {
+        "interview_id": [], "date": [], "video_file": [], "q_index": [],
+        "question": [], "start": [], "end": [], "transcription": [],
+    }
+    for path, data in interviews:
+        for i, a in enumerate(data["answers"]):
+            columns["interview_id"].append(Path(path).stem)
+            columns["date"].append(data.get("date"))
+            columns["video_file"].append(data.get("video_file"))
+            columns["q_index"].append(i)
+            columns["question"].append(a.get("question", ""))
+            columns["start"].append(a.get("start"))
+            columns["end"].append(a.get("end"))
+            columns["transcription"].append(a.get("transcription") or "")
+
+    df = pd.DataFrame(columns)
+    # explicit dtypes so the .str accessor also works on an empty frame
+    df["interview_id"] = df["interview_id"].astype(str)
+    df["transcription"] = df["transcription"].astype(str)
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df["start"] = pd.to_numeric(df["start"], errors="coerce")
+    df["end"] = pd.to_numeric(df["end"], errors="coerce")
+    # Questions repeat in every interview: a category saves memory and lets
+    # the regexes run over unique questions instead of every row
+    df["question"] = df["question"].astype(str).astype("category")
+    df["q_index"] = df["q_index"].astype(np.int16)
+    return df
+
+# ========== FEATURES ==========
+def add_features(df: pd.DataFrame) -> pd.DataFrame:
+    """Answer length and speaking rate from ``start``/``end`` and word counts."""
+    df = df.copy()
+    text = df["transcription"].fillna("")
+    df["is_error"] = text.str.startswith(ERROR_PREFIX)
+    df["duration"] = (df["end"] - df["start"]).clip(lower=0)
+    df["n_chars"] = text.str.len().astype(np.int32)
+    df["n_words"] = np.where(df["is_error"], 0, text.str.count(r"\S+")).astype(np.int32)
+    duration = df["duration"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wps = np.where(
+            (duration > 0) & ~df["is_error"].to_numpy(),
+            df["n_words"].to_numpy() / duration,
+            np.nan,
+        )
+    df["words_per_sec"] = wps
+    df["words_per_min"] = wps * 60
+    return df
+
+def add_risk_flags(df: pd.DataFrame, rules: list = RISK_RULES) -> pd.DataFrame:
+    """Add a ``flag_<name>`` column per flag in ``rules`` and their count ``n_flags``."""
+    df = df.copy()
+    raw = df["transcription"].fillna("").str.strip()
+    valid = (~raw.str.startswith(ERROR_PREFIX) & (raw != "")).to_numpy()
+    positive = raw.str.replace(NEGATED, " ", case=False, regex=True)
+    bare_yes = (
+        positive.str.contains(YES_WORDS, case=False, regex=True)
+        | (positive.str.contains(WAS_WORDS, case=False, regex=True)
+           & ~raw.str.contains(UNSURE, case=False, regex=True))
+    ).to_numpy()
+
+    questions = df["question"].astype("category")
+    categories = questions.cat.categories.to_series()
+    codes = questions.cat.codes.to_numpy()
+    known = codes >= 0
+
+    flags = {name: np.zeros(len(df), dtype=bool) for name in dict.fromkeys(r[0] for r in rules)}
+    any_hit = np.zeros(len(df), dtype=bool)
+    # unspecified rules run last so they can see the other flags on the answer
+    ordered = sorted(rules, key=lambda r: r[4] == UNSPECIFIED)
+    for name, q_pattern, a_pattern, raw_pattern, yes_mode in ordered:
+        # question patterns run once per unique question
+        cat_mask = categories.str.contains(q_pattern, case=False, regex=True).to_numpy()
+        mask = np.zeros(len(df), dtype=bool)
+        mask[known] = cat_mask[codes[known]]
+        mask &= valid
+
+        if mask.any():
+            if yes_mode == UNSPECIFIED:
+                hit = bare_yes[mask] & ~any_hit[mask]
+            else:
+                hit = bare_yes[mask] if yes_mode == BARE_YES else np.zeros(int(mask.sum()), dtype=bool)
+                if a_pattern:
+                    hit = hit | positive[mask].str.contains(a_pattern, case=False, regex=True).to_numpy()
+                if raw_pattern:
+                    hit = hit | raw[mask].str.contains(raw_pattern, case=False, regex=True).to_numpy()
+            mask[mask] = hit
+        flags[name] |= mask
+        any_hit |= mask
+
+    flag_cols = []
+    for name, mask in flags.items():
+        df[f"flag_{name}"] = mask
+        flag_cols.append(f"flag_{name}")
+    df["n_flags"] = df[flag_cols].sum(axis=1).astype(np.int16)
+    return df
+
+def analyze(df: pd.DataFrame) -> pd.DataFrame:
+    return add_risk_flags(add_features(df))
+
+# ========== AGGREGATES ==========
+def interview_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-interview summary of an ``analyze`` result."""
+    flag_cols = [c for c in df.columns if c.startswith("flag_")]
+    grouped = df.groupby("interview_id", sort=True)
+    summary = grouped.agg(
+        date=("date", "first"),
+        video_file=("video_file", "first"),
+        n_answers=("q_index", "size"),
+        n_errors=("is_error", "sum"),
+        total_duration=("duration", "sum"),
+        total_words=("n_words", "sum"),
+        median_wpm=("words_per_min", "median"),
+        n_flags=("n_flags", "sum"),
+    )
+    summary = summary.join(grouped[flag_cols].any())
+    summary["flagged"] = summary["n_flags"] > 0
+    return summary
+
+def cohort_summary(df: pd.DataFrame, by: str = "cohort") -> pd.DataFrame:
+    """Per-cohort aggregates; the default cohort is the interview month, or "unknown"."""
+    summary = interview_summary(df)
+    if by == "cohort" and by not in summary.columns:
+        summary[by] = summary["date"].dt.strftime("%Y-%m").fillna("unknown")
+    flag_cols = [c for c in summary.columns if c.startswith("flag_")]
+    grouped = summary.groupby(by, sort=True, dropna=False)
+    cohorts = grouped.agg(
+        n_interviews=("n_answers", "size"),
+        n_flagged=("flagged", "sum"),
+        mean_duration=("total_duration", "mean"),
+        median_wpm=("median_wpm", "median"),
+        n_answers=("n_answers", "sum"),
+        n_errors=("n_errors", "sum"),
+    )
+    cohorts["error_rate"] = cohorts["n_errors"] / cohorts["n_answers"]
+    cohorts["flagged_rate"] = cohorts["n_flagged"] / cohorts["n_interviews"]
+    # share of interviews with each flag
+    return cohorts.join(grouped[flag_cols].mean().add_suffix("_rate"))
+
+# ========== CLI ==========
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный анализ сохранённых интервью")
+    parser.add_argument("rec_dir", nargs="?", default=str(REC_DIR))
+    parser.add_argument("--answers-csv", help="сохранить ответы с признаками и флагами")
+    parser.add_argument("--interviews-csv", help="сохранить сводку по интервью")
+    args = parser.parse_args(argv)
+
+    df = load_answers(Path(args.rec_dir))
+    if df.empty:
+        print(f"Нет интервью в {args.rec_dir}")
+        return
+    df = analyze(df)
+
+    interviews = interview_summary(df)
+    if args.answers_csv:
+        df.to_csv(args.answers_csv, index=False)
+    if args.interviews_csv:
+        interviews.to_csv(args.interviews_csv)
+
+    print(f"Интервью: {len(interviews)}, ответов: {len(df)}, с флагами: {int(interviews['flagged'].sum())}")
+    flagged = df[df["n_flags"] > 0]
+    for row in flagged.itertuples():
+        flags = [c[len("flag_"):] for c in df.columns if c.startswith("flag_") and getattr(row, c)]
+        print(f"  {row.interview_id} #{row.q_index + 1} [{', '.join(flags)}]: {row.transcription}")
+    print()
+    print(cohort_summary(df).to_string())
+
+if __name__ == "__main__":
+    main()
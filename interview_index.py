@@ -0,0 +1,135 @@
+import hashlib
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from interview_analytics import RISK_RULES, analyze, answers_frame, interview_summary
+from interview_store import REC_DIR, file_mtime, iter_result_files, load_interview
+
+# ========== CONFIG ==========
+INDEX_FILE = "index.csv"
+INDEX_COLUMNS = [
+    "interview_id", "json_file", "date", "video_file", "has_video",
+    "n_answers", "n_errors", "total_duration", "n_flags", "flags", "mtime",
+    "rules_hash",
+]
+# rows scored with other risk rules are re-scored on the next update
+RULES_HASH = hashlib.sha1(repr(RISK_RULES).encode("utf-8")).hexdigest()[:12]
+
+# ========== BUILD ==========
+def _empty_index() -> pd.DataFrame:
+    return pd.DataFrame(columns=INDEX_COLUMNS)
+
+def _read_index(index_path: Path) -> pd.DataFrame:
+    if not index_path.exists():
+        return _empty_index()
+    try:
+        index = pd.read_csv(index_path, dtype={
+            "interview_id": str, "date": str, "video_file": str, "flags": str,
+            "rules_hash": str,
+        }, float_precision="round_trip")  # mtime must compare equal after a reload
+    except (OSError, ValueError):
+        return _empty_index()
+    if list(index.columns) != INDEX_COLUMNS:
+        return _empty_index()
+    text_cols = ["date", "video_file", "flags", "rules_hash"]
+    index[text_cols] = index[text_cols].fillna("")
+    return index
+
+def _has_video(rec_dir: Path, video_file) -> bool:
+    return isinstance(video_file, str) and video_file != "" and (rec_dir / video_file).exists()
+
+def _index_rows(paths, rec_dir: Path) -> pd.DataFrame:
+    interviews = []
+    for path in paths:
+        data = load_interview(path)
+        if data is not None:
+            interviews.append((path, data))
+    if not interviews:
+        return _empty_index()
+
+    summary = interview_summary(analyze(answers_frame(interviews))).reset_index()
+    flag_cols = [c for c in summary.columns if c.startswith("flag_")]
+    flags = summary[flag_cols].to_numpy()
+    names = np.array([c[len("flag_"):] for c in flag_cols])
+    summary["flags"] = [",".join(names[row]) for row in flags]
+
+    files = {Path(p).stem: Path(p) for p, _ in interviews}
+    summary["json_file"] = summary["interview_id"].map(lambda i: files[i].name)
+    summary["mtime"] = summary["interview_id"].map(lambda i: file_mtime(files[i]))
+    summary["video_file"] = summary["video_file"].fillna("")
+    summary["has_video"] = summary["video_file"].map(lambda v: _has_video(rec_dir, v))
+    summary["date"] = summary["date"].astype(str).replace("NaT", "")
+    summary["rules_hash"] = RULES_HASH
+    return summary[INDEX_COLUMNS]
+
+def update_index(rec_dir: Path = REC_DIR) -> pd.DataFrame:
+    """Update ``index.csv``, re-reading only new, changed or differently scored interviews."""
+    rec_dir = Path(rec_dir)
+    index_path = rec_dir / INDEX_FILE
+    index = _read_index(index_path)
+
+    paths = {p.stem: p for p in iter_result_files(rec_dir)}
+    mtimes = {stem: file_mtime(p) for stem, p in paths.items()}
+    known = dict(zip(index["interview_id"], zip(index["mtime"], index["rules_hash"])))
+    stale = [p for stem, p in paths.items() if known.get(stem) != (mtimes[stem], RULES_HASH)]
+    removed = set(known) - set(paths)
+
+    # a recording may appear (or go away) after its JSON was indexed
+    has_video = np.array([_has_video(rec_dir, v) for v in index["video_file"]], dtype=bool)
+    video_changed = bool((has_video != index["has_video"].to_numpy(dtype=bool)).any())
+
+    if not stale and not removed and not video_changed:
+        return index
+
+    index["has_video"] = has_video
+    keep = index[~index["interview_id"].isin(removed | {p.stem for p in stale})]
+    fresh = _index_rows(stale, rec_dir)
+    parts = [df for df in (keep, fresh) if not df.empty]
+    index = pd.concat(parts, ignore_index=True) if parts else _empty_index()
+    # files that are not interview results are remembered as empty rows so
+    # they are not re-read on every update
+    skipped = [p for p in stale if p.stem not in set(fresh["interview_id"])]
+    if skipped:
+        index = pd.concat([index, pd.DataFrame({
+            "interview_id": [p.stem for p in skipped],
+            "json_file": [p.name for p in skipped],
+            "date": "", "video_file": "", "has_video": False,
+            "n_answers": 0, "n_errors": 0, "total_duration": 0.0,
+            "n_flags": 0, "flags": "",
+            "mtime": [mtimes[p.stem] for p in skipped],
+            "rules_hash": RULES_HASH,
+        })], ignore_index=True)
+
+    index = index.sort_values("date", ascending=False, ignore_index=True)
+    index.to_csv(index_path, index=False)
+    return index
+
+# ========== QUERY ==========
+def filter_index(index: pd.DataFrame, search="", flagged_only=False, flags=(),
+                 date_from=None, date_to=None) -> pd.DataFrame:
+    """Interviews of the index matching the filters."""
+    mask = index["n_answers"].to_numpy() > 0
+    if search:
+        text = index["interview_id"].str.cat(index["video_file"].fillna(""), sep=" ")
+        mask &= text.str.contains(search, case=False, regex=False).to_numpy()
+    if flagged_only:
+        mask &= index["n_flags"].to_numpy() > 0
+    for flag in flags:
+        mask &= index["flags"].str.split(",").map(lambda f: flag in f).to_numpy(dtype=bool)
+    if date_from is not None or date_to is not None:
+        dates = pd.to_datetime(index["date"], errors="coerce").dt.date
+        if date_from is not None:
+            mask &= (dates >= date_from).to_numpy(dtype=bool)
+        if date_to is not None:
+            mask &= (dates <= date_to).to_numpy(dtype=bool)
+    return index[mask]
+
+def paginate(found: pd.DataFrame, page: int, page_size: int):
+    """Return ``(rows, page, pages)`` with ``page`` clamped to ``1..pages``."""
+    pages = max(1, math.ceil(len(found) / page_size))
+    page = min(max(int(page), 1), pages)
+    start = (page - 1) * page_size
+    return found.iloc[start:start + page_size], page, pages
@@ -0,0 +1,98 @@
+import datetime
+import json
+from pathlib import Path
+
+# ========== CONFIG ==========
+REC_DIR = Path("recordings")
+EDITS_SUFFIX = ".edits.jsonl"
+
+# ========== FILES ==========
+def edits_path(json_path: Path) -> Path:
+    return Path(json_path).with_suffix(EDITS_SUFFIX)
+
+def iter_result_files(rec_dir: Path = REC_DIR):
+    # *.json does not match *.edits.jsonl
+    return sorted(Path(rec_dir).glob("*.json"))
+
+def file_mtime(json_path: Path) -> float:
+    """Last modification time of an interview, including its edits file."""
+    mtime = Path(json_path).stat().st_mtime
+    edits = edits_path(json_path)
+    if edits.exists():
+        mtime = max(mtime, edits.stat().st_mtime)
+    return mtime
+
+# ========== LOADING ==========
+def read_edits(json_path: Path):
+    edits = []
+    path = edits_path(json_path)
+    if not path.exists():
+        return edits
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                edits.append(json.loads(line))
+            except json.JSONDecodeError:
+                # last line left half-written by a crash
+                continue
+    return edits
+
+def load_interview(json_path: Path):
+    """Interview results with edits applied, or ``None`` if the file has no ``answers`` list."""
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("answers"), list):
+        return None
+
+    answers = data["answers"]
+    for edit in read_edits(json_path):
+        i = edit.get("index")
+        if isinstance(i, int) and 0 <= i < len(answers):
+            answers[i]["transcription"] = edit.get("new", "")
+    return data
+
+def iter_interviews(rec_dir: Path = REC_DIR):
+    for path in iter_result_files(rec_dir):
+        data = load_interview(path)
+        if data is not None:
+            yield path, data
+
+# ========== EDITS ==========
+def append_edit(json_path: Path, index: int, old: str, new: str):
+    """Append an answer edit to ``<name>.edits.jsonl`` instead of rewriting the JSON."""
+    if old == new:
+        return
+    record = {
+        "ts": datetime.datetime.now().isoformat(),
+        "index": index,
+        "old": old,
+        "new": new,
+    }
+    path = edits_path(json_path)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    # start on a fresh line if a previous write was cut off
+    if path.exists() and path.stat().st_size > 0:
+        with open(path, "rb") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                line = "\n" + line
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+def save_widget_edit(json_path: Path, index: int, key: str, state):
+    """``on_change`` callback for ``st.text_area``: save the widget value ``state[key]``.
+
+    ``old`` is taken from the saved interview with earlier edits applied, so
+    the records in the edits file chain.
+    """
+    data = load_interview(json_path)
+    if data is None or not 0 <= index < len(data["answers"]):
+        return
+    old = data["answers"][index].get("transcription", "")
+    append_edit(json_path, index, old, state[key])
@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+from urllib.parse import quote, urljoin
+
+import streamlit as st
+
+from interview_analytics import FLAG_NAMES
+from interview_index import filter_index, paginate, update_index
+from interview_store import REC_DIR, load_interview, save_widget_edit
+
+st.set_page_config(page_title="Просмотр интервью", layout="wide")
+st.title("Просмотр интервью")
+
+# ========== CONFIG ==========
+# Recordings are hard-linked into static/recordings and served by Streamlit
+# static serving (.streamlit/config.toml), which streams Range requests from
+# disk. Tornado refuses symlinks that leave static/, hard links are plain files.
+STATIC_REC_DIR = Path("static") / "recordings"
+STATIC_REC_URL = "app/static/recordings/"
+# Streamlit refuses to serve static files larger than this
+STATIC_MAX_SIZE = 200 * 1024 * 1024
+
+# ========== HELPERS ==========
+def video_source(video_file: str):
+    """URL of the recording under static serving, or its path as a fallback."""
+    src = REC_DIR / video_file
+    dst = STATIC_REC_DIR / video_file
+    # st.video only treats absolute http(s) strings as URLs
+    if st.context.url and src.stat().st_size <= STATIC_MAX_SIZE:
+        try:
+            if dst.exists() and not os.path.samefile(src, dst):
+                dst.unlink()
+            if not dst.exists():
+                STATIC_REC_DIR.mkdir(parents=True, exist_ok=True)
+                os.link(src, dst)
+            return urljoin(st.context.url, STATIC_REC_URL + quote(video_file))
+        except OSError:
+            pass
+    # st.video(path) reads the whole file into Streamlit's in-memory media storage
+    return str(src)
+
+def show_answers(json_path: Path, interview_id: str):
+    data = load_interview(json_path)
+    if data is None:
+        st.error("Не удалось прочитать файл результатов.")
+        return
+    for i, r in enumerate(data["answers"]):
+        st.write(f"**Вопрос:** {r.get('question', '')}")
+        unique_key = f"review_edit_{interview_id}_{i}"
+        st.text_area(
+            label="Ответ:",
+            value=r.get("transcription", ""),
+            key=unique_key,
+            # only the changed answer is appended to <name>.edits.jsonl
+            on_change=save_widget_edit,
+            args=(json_path, i, unique_key, st.session_state),
+        )
+        if r.get("start") is not None and r.get("end") is not None:
+            st.write(f"**Отрезок:** {r['start']:.2f} — {r['end']:.2f} сек.")
+        st.divider()
+
+# ========== FILTERS ==========
+index = update_index(REC_DIR)
+
+with st.sidebar:
+    st.header("Фильтры")
+    search = st.text_input("Поиск по имени файла")
+    flagged_only = st.checkbox("Только с флагами риска")
+    flags = st.multiselect("Флаги", FLAG_NAMES)
+    use_dates = st.checkbox("Фильтр по дате")
+    date_from = date_to = None
+    if use_dates:
+        date_from = st.date_input("С даты")
+        date_to = st.date_input("По дату")
+    page_size = st.selectbox("На странице", [10, 20, 50], index=1)
+
+found = filter_index(index, search, flagged_only, flags, date_from, date_to)
+page = st.sidebar.number_input("Страница", min_value=1, value=1, step=1)
+rows, page, pages = paginate(found, page, page_size)
+
+st.caption(f"Найдено интервью: {len(found)} · страница {page} из {pages}")
+
+# ========== LIST ==========
+for row in rows.itertuples():
+    json_path = REC_DIR / row.json_file
+    title = f"**{row.interview_id}** · {row.date or 'без даты'} · ответов: {row.n_answers}"
+    if row.flags:
+        title += f" · ⚠️ {row.flags.replace(',', ', ')}"
+    st.markdown(title)
+
+    # answers and video are loaded on request, not for the whole page
+    show_text = st.toggle("Показать ответы", key=f"show_answers_{row.interview_id}")
+    show_video = False
+    if row.has_video:
+        show_video = st.toggle("Показать видео", key=f"show_video_{row.interview_id}")
+
+    if show_text:
+        show_answers(json_path, row.interview_id)
+    if show_video:
+        st.video(video_source(row.video_file))
+    st.divider()
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from interview_analytics import analyze, answers_frame, cohort_summary, interview_summary
+
+FAMILY_SUICIDE = "были ли самоубийства или суицидальные попытки у родственников "
+SELF_SUICIDE = "имелись ли у Вас в прошлом суицидальные попытки/мысли "
+FAMILY_HISTORY = (
+    "Были ли в Вашей семье или у ближайших родственников: / алкоголизм /наркомания/  "
+    "судимость /наследственные нервно-психические заболевания "
+)
+SELF_HISTORY = (
+    "Были ли у Вас до армии факты: / алкоголизма /наркомании / судимости / "
+    "наследственные нервно-психические заболевания, /игромания "
+)
+LOANS = "есть у тебя кредиты/займы (сколько, на какую сумму, кто оплачивает)"
+VVK = (
+    "При прохождении ВВК в ДДО полностью ли Вы прошли обследование у врачей, есть ли факты "
+    "относительно Вашего здоровья (диагнозы по которым ранее Вас не брали на службу), "
+    "о которых Вы не сказали вашему старшему"
+)
+SERVICE = "Желаете ли вы проходить военную службу (да/нет, причина )"
+
+
+def _interview(answers, date="2025-08-13T12:13:54", name="20250813_121327"):
+    return (f"recordings/{name}.json", {
+        "date": date,
+        "video_file": f"{name}.mp4",
+        "answers": [
+            {"question": q, "start": i * 10.0, "end": i * 10.0 + 5.0, "transcription": t}
+            for i, (q, t) in enumerate(answers)
+        ],
+    })
+
+
+def _flags(question, answer):
+    df = analyze(answers_frame([_interview([(question, answer)])]))
+    row = df.iloc[0]
+    return {c[len("flag_"):] for c in df.columns if c.startswith("flag_") and row[c]}
+
+
+@pytest.mark.parametrize("question, answer", [
+    (SELF_HISTORY, "Нет, не был судим"),
+    (FAMILY_SUICIDE, "Нет, не было такого"),
+    (SELF_SUICIDE, "Нет, никогда"),
+    (LOANS, "Нет кредитов"),
+    (LOANS, "Нет, кредитов нет"),
+    (VVK, "Да, полностью прошёл, всё сказал"),
+    (SERVICE, "Да, хочу"),
+    (SELF_HISTORY, "Судимостей не было"),
+    (SELF_SUICIDE, "Суицидальных мыслей не было"),
+    (FAMILY_SUICIDE, "Самоубийств не было"),
+    (LOANS, "Кредитов не брал"),
+    (LOANS, "Кредитов не имею"),
+    (SELF_HISTORY, "Алкоголь не употребляю"),
+    (SELF_HISTORY, "Наркотики никогда не пробовал"),
+    (SELF_HISTORY, "нет не пил не курил"),
+    (FAMILY_SUICIDE, "Не знаю, были ли"),
+])
+def test_denials_and_neutral_answers_are_not_flagged(question, answer):
+    assert _flags(question, answer) == set()
+
+
+@pytest.mark.parametrize("question, answer, expected", [
+    (FAMILY_HISTORY, "Да, дядя сидел в тюрьме", {"family_criminal"}),
+    (FAMILY_HISTORY, "Отец пьёт, брат судим", {"family_substance", "family_criminal"}),
+    (SELF_HISTORY, "Не судим, но пил", {"substance"}),
+    (SELF_HISTORY, "Делал ставки", {"gambling"}),
+    (FAMILY_HISTORY, "Да", {"family_history_unspecified"}),
+    (SELF_HISTORY, "Да, было", {"history_unspecified"}),
+    (SELF_HISTORY, "Нет, но отец пил", {"substance"}),
+    (FAMILY_SUICIDE, "Да, двоюродный брат", {"family_suicide"}),
+    (SELF_SUICIDE, "Да, были мысли", {"suicide"}),
+    (LOANS, "Есть кредит 200 тысяч", {"debt"}),
+    (VVK, "Не сказал про диагноз", {"hidden_health"}),
+    (SERVICE, "Нет, не хочу", {"unwilling_service"}),
+])
+def test_risk_answers_are_flagged(question, answer, expected):
+    assert _flags(question, answer) == expected
+
+
+def test_error_answers_have_no_speaking_rate():
+    df = analyze(answers_frame([_interview([
+        (SELF_SUICIDE, "Ошибка при обработке"),
+        (LOANS, "Ошибка при обработке"),
+        (SERVICE, "Да, хочу служить"),
+    ])]))
+    assert np.isnan(df["words_per_min"].iloc[0])
+    assert interview_summary(df)["median_wpm"].iloc[0] == pytest.approx(36.0)
+
+
+def test_empty_input():
+    df = analyze(answers_frame([]))
+    assert df.empty
+    assert interview_summary(df).empty
+
+
+def test_cohort_keeps_interviews_without_date():
+    df = analyze(answers_frame([
+        _interview([(LOANS, "Нет")], name="a"),
+        _interview([(LOANS, "Нет")], date=None, name="b"),
+    ]))
+    cohorts = cohort_summary(df)
+    assert cohorts.loc["unknown", "n_interviews"] == 1
+    assert cohorts["n_interviews"].sum() == 2
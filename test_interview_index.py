@@ -0,0 +1,118 @@
+import datetime
+import json
+import os
+
+import pytest
+
+import interview_index
+from interview_index import INDEX_FILE, filter_index, paginate, update_index
+from interview_store import append_edit
+
+SELF_SUICIDE = "имелись ли у Вас в прошлом суицидальные попытки/мысли "
+
+
+def _write_interview(rec_dir, name, answer="Нет", date="2025-08-13T12:13:54"):
+    path = rec_dir / f"{name}.json"
+    path.write_text(json.dumps({
+        "date": date,
+        "video_file": f"{name}.mp4",
+        "answers": [{"question": SELF_SUICIDE, "start": 0.0, "end": 2.0, "transcription": answer}],
+    }, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def _rows(index):
+    return index.set_index("interview_id")
+
+
+@pytest.fixture
+def rec_dir(tmp_path):
+    _write_interview(tmp_path, "a", date="2025-08-01T10:00:00")
+    _write_interview(tmp_path, "b", answer="Да, были", date="2025-09-01T10:00:00")
+    (tmp_path / "questions.json").write_text('["вопрос"]', encoding="utf-8")
+    return tmp_path
+
+
+def test_build_and_csv_round_trip(rec_dir):
+    index = update_index(rec_dir)
+    rows = _rows(index)
+    assert rows.loc["b", "flags"] == "suicide"
+    assert rows.loc["a", "n_flags"] == 0
+    assert rows.loc["questions", "n_answers"] == 0
+
+    # mtimes survive the CSV round trip, so nothing is re-read
+    mtime = (rec_dir / INDEX_FILE).stat().st_mtime_ns
+    reread = update_index(rec_dir)
+    assert (rec_dir / INDEX_FILE).stat().st_mtime_ns == mtime
+    assert reread.equals(interview_index._read_index(rec_dir / INDEX_FILE))
+
+
+def test_edit_rescores_only_that_row(rec_dir, monkeypatch):
+    update_index(rec_dir)
+    append_edit(rec_dir / "a.json", 0, "Нет", "Да, пытался")
+    # make sure the edits file mtime differs on coarse-grained filesystems
+    stamp = os.stat(rec_dir / "a.json").st_mtime + 5
+    os.utime(rec_dir / "a.edits.jsonl", (stamp, stamp))
+
+    scored = []
+    real_index_rows = interview_index._index_rows
+
+    def spy(paths, rec_dir):
+        scored.extend(p.stem for p in paths)
+        return real_index_rows(paths, rec_dir)
+
+    monkeypatch.setattr(interview_index, "_index_rows", spy)
+    rows = _rows(update_index(rec_dir))
+    assert scored == ["a"]
+    assert rows.loc["a", "flags"] == "suicide"
+
+
+def test_deleted_json_drops_row(rec_dir):
+    update_index(rec_dir)
+    (rec_dir / "b.json").unlink()
+    assert set(update_index(rec_dir)["interview_id"]) == {"a", "questions"}
+
+
+def test_rules_change_rescores(rec_dir, monkeypatch):
+    update_index(rec_dir)
+    monkeypatch.setattr(interview_index, "RULES_HASH", "changed")
+    index = update_index(rec_dir)
+    assert set(index["rules_hash"]) == {"changed"}
+
+
+def test_video_added_later(rec_dir):
+    assert not _rows(update_index(rec_dir)).loc["a", "has_video"]
+    (rec_dir / "a.mp4").write_bytes(b"\0")
+    assert _rows(update_index(rec_dir)).loc["a", "has_video"]
+
+
+def test_filters(rec_dir):
+    index = update_index(rec_dir)
+    assert list(filter_index(index)["interview_id"]) == ["b", "a"]
+    assert list(filter_index(index, flagged_only=True)["interview_id"]) == ["b"]
+    assert list(filter_index(index, flags=["suicide"])["interview_id"]) == ["b"]
+    assert list(filter_index(index, search="A")["interview_id"]) == ["a"]
+    since = filter_index(index, date_from=datetime.date(2025, 8, 15))
+    assert list(since["interview_id"]) == ["b"]
+
+
+@pytest.mark.parametrize("page, page_size, expected_ids, expected_page, expected_pages", [
+    (1, 2, ["i0", "i1"], 1, 3),
+    (3, 2, ["i4"], 3, 3),
+    (4, 2, ["i4"], 3, 3),
+    (0, 2, ["i0", "i1"], 1, 3),
+    (1, 5, ["i0", "i1", "i2", "i3", "i4"], 1, 1),
+])
+def test_paginate_bounds(tmp_path, page, page_size, expected_ids, expected_page, expected_pages):
+    for i in range(5):
+        _write_interview(tmp_path, f"i{i}", date=f"2025-08-0{9 - i}T10:00:00")
+    found = filter_index(update_index(tmp_path))
+    rows, page, pages = paginate(found, page, page_size)
+    assert list(rows["interview_id"]) == expected_ids
+    assert (page, pages) == (expected_page, expected_pages)
+
+
+def test_paginate_empty(tmp_path):
+    rows, page, pages = paginate(filter_index(update_index(tmp_path)), 3, 20)
+    assert rows.empty
+    assert (page, pages) == (1, 1)
@@ -0,0 +1,69 @@
+import json
+
+from interview_store import append_edit, edits_path, load_interview, read_edits, save_widget_edit
+
+
+def _write_interview(path, *transcriptions):
+    path.write_text(json.dumps({
+        "date": "2025-08-13T12:13:54",
+        "video_file": path.with_suffix(".mp4").name,
+        "answers": [
+            {"question": f"q{i}", "start": 0.0, "end": 1.0, "transcription": t}
+            for i, t in enumerate(transcriptions)
+        ],
+    }, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_consecutive_edits_chain(tmp_path):
+    path = _write_interview(tmp_path / "a.json", "стт", "другой")
+    state = {"k": "первая правка"}
+    save_widget_edit(path, 0, "k", state)
+    state["k"] = "вторая правка"
+    save_widget_edit(path, 0, "k", state)
+
+    edits = read_edits(path)
+    assert [(e["old"], e["new"]) for e in edits] == [
+        ("стт", "первая правка"),
+        ("первая правка", "вторая правка"),
+    ]
+    answers = load_interview(path)["answers"]
+    assert answers[0]["transcription"] == "вторая правка"
+    assert answers[1]["transcription"] == "другой"
+    # the original JSON is not rewritten
+    assert json.loads(path.read_text(encoding="utf-8"))["answers"][0]["transcription"] == "стт"
+
+
+def test_unchanged_value_is_not_recorded(tmp_path):
+    path = _write_interview(tmp_path / "a.json", "стт")
+    save_widget_edit(path, 0, "k", {"k": "стт"})
+    assert not edits_path(path).exists()
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    path = _write_interview(tmp_path / "a.json", "стт", "второй")
+    append_edit(path, 0, "стт", "правка")
+    with open(edits_path(path), "a", encoding="utf-8") as f:
+        f.write('{"ts": "2025-08-13", "index": 1, "ne')
+
+    assert len(read_edits(path)) == 1
+    assert load_interview(path)["answers"][1]["transcription"] == "второй"
+
+    # the next edit starts on its own line and is not lost
+    append_edit(path, 1, "второй", "новый")
+    assert load_interview(path)["answers"][1]["transcription"] == "новый"
+
+
+def test_out_of_range_index(tmp_path):
+    path = _write_interview(tmp_path / "a.json", "стт")
+    save_widget_edit(path, 5, "k", {"k": "лишнее"})
+    assert not edits_path(path).exists()
+
+    append_edit(path, 5, "", "лишнее")
+    assert [a["transcription"] for a in load_interview(path)["answers"]] == ["стт"]
+
+
+def test_non_answers_file_is_not_an_interview(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text('["вопрос"]', encoding="utf-8")
+    assert load_interview(path) is None